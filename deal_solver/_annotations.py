@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing
 from types import MappingProxyType
+from weakref import WeakKeyDictionary
 
 import astroid
 import z3
@@ -34,6 +35,16 @@ ALIASES = MappingProxyType({
     'AnyStr': 'str',
     'FrozenSet': 'set',
 })
+# SIMPLE_SORTS extended by aliases, so that a type name is resolved in one lookup
+NAMED_SORTS: typing.Mapping[str, type[ProxySort]]
+NAMED_SORTS = MappingProxyType({
+    **{
+        alias: SIMPLE_SORTS[name]
+        for alias, name in ALIASES.items()
+        if name in SIMPLE_SORTS
+    },
+    **SIMPLE_SORTS,
+})
 MaybeSort = typing.Optional[ProxySort]
 
 
@@ -50,16 +61,38 @@ GENERICS = MappingProxyType({
 })
 
 
+class SortInfo(typing.NamedTuple):
+    type: type[ProxySort]
+    sort: z3.SortRef
+
+
+# The sort of floats depends on FloatSort.prefer_real, so it's a part of the key.
+SortKey = typing.Tuple[typing.Optional[z3.Context], bool]
+_sorts_cache: WeakKeyDictionary[AstNode, dict[SortKey, SortInfo | None]]
+_sorts_cache = WeakKeyDictionary()
+
+
+def ann2sort(*, node: AstNode, ctx: z3.Context | None) -> SortInfo | None:
+    """Get the proxy type and z3 sort for the annotation.
+
+    Unlike ann2type, it doesn't create a variable, so the result is cached.
+    """
+    cache = _sorts_cache.setdefault(node, dict())
+    key = (ctx, types.float.prefer_real)
+    if key not in cache:
+        value = ann2type(name='_', node=node, ctx=ctx)
+        if value is None:
+            cache[key] = None
+        else:
+            cache[key] = SortInfo(type=type(value), sort=value.sort())
+    return cache[key]
+
+
 def ann2type(*, name: str, node: AstNode, ctx: z3.Context) -> MaybeSort:
-    if isinstance(node, astroid.Attribute):
-        return _sort_from_attr(name=name, node=node, ctx=ctx)
-    if isinstance(node, astroid.Name):
-        return _sort_from_name(name=name, node=node, ctx=ctx)
-    if isinstance(node, astroid.Const) and type(node.value) is str:
-        return _sort_from_str(name=name, node=node, ctx=ctx)
-    if isinstance(node, astroid.Subscript):
-        return _sort_from_getattr(name=name, node=node, ctx=ctx)
-    return None
+    handler = HANDLERS.get(type(node))
+    if handler is None:
+        return None
+    return handler(name=name, node=node, ctx=ctx)
 
 
 def _sort_from_attr(*, name: str, node: astroid.Attribute, ctx: z3.Context) -> MaybeSort:
@@ -77,16 +110,16 @@ def _sort_from_attr(*, name: str, node: astroid.Attribute, ctx: z3.Context) -> M
 
 
 def _sort_from_name(*, name: str, node: astroid.Name, ctx: z3.Context) -> MaybeSort:
-    type_name = ALIASES.get(node.name, node.name)
-    sort = SIMPLE_SORTS.get(type_name)
+    sort = NAMED_SORTS.get(node.name)
     if sort is None:
         return None
     return sort.var(name=name, ctx=ctx)
 
 
 def _sort_from_str(*, name: str, node: astroid.Const, ctx: z3.Context) -> MaybeSort:
-    type_name = ALIASES.get(node.value, node.value)
-    sort = SIMPLE_SORTS.get(type_name)
+    if type(node.value) is not str:
+        return None
+    sort = NAMED_SORTS.get(node.value)
     if sort is None:
         return None
     return sort.var(name=name, ctx=ctx)
@@ -142,3 +175,12 @@ def _is_var_tuple(nodes: list) -> bool:
     if isinstance(last, astroid.Const):
         return last.value is Ellipsis
     return False
+
+
+HANDLERS: typing.Mapping[type[AstNode], typing.Callable[..., MaybeSort]]
+HANDLERS = MappingProxyType({
+    astroid.Attribute:  _sort_from_attr,
+    astroid.Name:       _sort_from_name,
+    astroid.Const:      _sort_from_str,
+    astroid.Subscript:  _sort_from_getattr,
+})
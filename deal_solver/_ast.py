@@ -37,7 +37,21 @@ def get_full_name(expr) -> tuple[str, str]:
     return path, func_name
 
 
+# Inferred definitions are stored on the node itself. The definitions often
+# refer back to the node's tree, so a global cache would keep the tree alive.
+INFER_CACHE_ATTR = '_deal_solver_inferred'
+
+
 def infer(expr: astroid.NodeNG) -> tuple[AstNode, ...]:
+    """Infer the node definitions, caching the result on the node."""
+    guesses = expr.__dict__.get(INFER_CACHE_ATTR)
+    if guesses is None:
+        guesses = _infer(expr)
+        expr.__dict__[INFER_CACHE_ATTR] = guesses
+    return guesses
+
+
+def _infer(expr: astroid.NodeNG) -> tuple[AstNode, ...]:
     with suppress(InferenceError, RecursionError):
         guesses = expr.infer()
         if guesses is astroid.Uninferable:  # pragma: no cover
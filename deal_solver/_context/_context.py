@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 
 import z3
 
-from ._layer import ExceptionInfo, Layer, ReturnInfo
+from ._layer import ConstraintLayer, ExceptionInfo, Layer, ReturnInfo
 from ._scope import Scope
 from ._trace import Trace
 
@@ -13,6 +14,17 @@ if typing.TYPE_CHECKING:
     from .._proxies import BoolSort, ProxySort
 
 
+@lru_cache(maxsize=None)
+def _exception_names(exc: type) -> frozenset[str]:
+    return frozenset(base.__name__ for base in exc.mro()[:-1])
+
+
+@lru_cache(maxsize=None)
+def _bool_val(value: bool, z3_ctx: z3.Context | None) -> BoolSort:
+    from .._proxies import BoolSort
+    return BoolSort(expr=z3.BoolVal(value, ctx=z3_ctx))
+
+
 class Context(typing.NamedTuple):
     # z3 context which should be used everywhere where z3 asks to use it.
     # Since z3 freaks out when we provide an explicit context
@@ -25,7 +37,7 @@ class Context(typing.NamedTuple):
 
     # Given are checks that we don't validate but assume them to be always true.
     # For example, post-conditions of all functions the current function calls.
-    given: Layer[BoolSort]
+    given: ConstraintLayer
 
     # Expected are checks we do validate. For example, all `assert` statements.
     expected: Layer[BoolSort]
@@ -48,7 +60,7 @@ class Context(typing.NamedTuple):
         obj = cls(
             z3_ctx=None,
             scope=Scope.make_empty(),
-            given=Layer(),
+            given=ConstraintLayer(),
             expected=Layer(),
             exceptions=Layer(),
             returns=Layer(),
@@ -58,6 +70,14 @@ class Context(typing.NamedTuple):
         )
         return obj.evolve(**kwargs)
 
+    @property
+    def true(self) -> BoolSort:
+        return _bool_val(True, self.z3_ctx)
+
+    @property
+    def false(self) -> BoolSort:
+        return _bool_val(False, self.z3_ctx)
+
     @property
     def interrupted(self) -> BoolSort:
         from .._proxies import or_expr
@@ -69,12 +89,11 @@ class Context(typing.NamedTuple):
 
     def add_exception(self, exc: type, msg: str = '', cond: BoolSort | None = None) -> None:
         if cond is None:
-            from .._proxies import BoolSort
-            cond = BoolSort.val(True, ctx=self)
+            cond = self.true
 
         self.exceptions.add(ExceptionInfo(
             name=exc.__name__,
-            names={base.__name__ for base in exc.mro()[:-1]},
+            names=_exception_names(exc),
             cond=cond,
             message=msg,
         ))
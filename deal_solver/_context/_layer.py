@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import typing
 
+import z3
+
 
 if typing.TYPE_CHECKING:
     from .._context import Context
@@ -13,7 +15,7 @@ T = typing.TypeVar('T')
 
 class ExceptionInfo(typing.NamedTuple):
     name: str               # exception name
-    names: set[str]  # exception name and names of all its bases
+    names: typing.AbstractSet[str]  # exception name and names of all its bases
     cond: BoolSort        # indicates if the exception is raised
     message: str = ''
 
@@ -59,3 +61,39 @@ class Layer(typing.Generic[T]):
             n=type(self).__name__,
             r=repr(self.layer),
         )
+
+
+class ConstraintLayer(Layer['BoolSort']):
+    """Layer of assumptions that skips trivial and repeated constraints.
+
+    Constraints are simplified only to check if they are always true
+    or already stored in this layer or any of its parents. The original
+    expression is stored because simplification can change how z3
+    instantiates quantifiers.
+    """
+    __slots__ = ['ids']
+
+    ids: set[int]
+    parent: ConstraintLayer | None
+
+    def __init__(self, parent: ConstraintLayer | None = None) -> None:
+        super().__init__(parent=parent)
+        self.ids = set()
+
+    def add(self, item: BoolSort) -> None:
+        expr = z3.simplify(item.expr)
+        if z3.is_true(expr):
+            return
+        expr_id = expr.get_id()
+        if self._contains(expr_id):
+            return
+        self.ids.add(expr_id)
+        self.layer.append(item)
+
+    def _contains(self, expr_id: int) -> bool:
+        layer: ConstraintLayer | None = self
+        while layer is not None:
+            if expr_id in layer.ids:
+                return True
+            layer = layer.parent
+        return False
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+import sys
 import typing
+from weakref import WeakKeyDictionary
 
 import astroid
 import z3
 
-from ._annotations import ann2type
+from ._annotations import ann2sort
 from ._ast import infer
 from ._context import Context, ExceptionInfo, ReturnInfo
 from ._eval_expr import eval_expr
 from ._exceptions import UnsupportedError
-from ._proxies import if_expr, or_expr, types
+from ._proxies import if_expr, or_expr
 from ._registry import HandlersRegistry
 
 
 eval_stmt: HandlersRegistry[None] = HandlersRegistry()
+_bases_cache: WeakKeyDictionary[astroid.NodeNG, ExceptionNames] = WeakKeyDictionary()
+
+
+class ExceptionNames(typing.NamedTuple):
+    name: str                   # exception name
+    names: frozenset[str]       # exception name and names of all its bases
 
 
 @eval_stmt.register(astroid.FunctionDef)
@@ -25,15 +33,14 @@ def eval_func(node: astroid.FunctionDef, ctx: Context) -> None:
         # generate function signature
         sorts = [arg.sort() for arg in args]
         assert node.returns, 'cannot find type annotation for already executed func'
-        sort = ann2type(name='_', node=node.returns, ctx=ctx.z3_ctx)
-        assert sort is not None, 'cannot eval type annotation for already executed func'
-        sorts.append(sort.sort())
+        info = ann2sort(node=node.returns, ctx=ctx.z3_ctx)
+        assert info is not None, 'cannot eval type annotation for already executed func'
+        sorts.append(info.sort)
 
         func = z3.Function(node.name, *sorts)
-        proxy = type(sort)
         ctx.returns.add(ReturnInfo(
-            value=proxy(func(*args)),
-            cond=types.bool.val(True, ctx=ctx),
+            value=info.type(func(*args)),
+            cond=ctx.true,
         ))
         return
 
@@ -95,7 +102,16 @@ def eval_if_else(node: astroid.If, ctx: Context) -> None:
     assert node.test
     assert node.body
 
-    test_ref = eval_expr(node=node.test, ctx=ctx)
+    # convert the condition into bool only once for all merged values
+    test_ref = eval_expr(node=node.test, ctx=ctx).m_bool(ctx=ctx)
+
+    # if the condition is known in advance, evaluate only the taken branch
+    test_expr = z3.simplify(test_ref.expr)
+    if z3.is_true(test_expr) or z3.is_false(test_expr):
+        body = node.body if z3.is_true(test_expr) else node.orelse
+        for subnode in (body or []):
+            eval_stmt(node=subnode, ctx=ctx)
+        return
 
     ctx_then = ctx.make_child()
     for subnode in node.body:
@@ -104,25 +120,33 @@ def eval_if_else(node: astroid.If, ctx: Context) -> None:
     for subnode in (node.orelse or []):
         eval_stmt(node=subnode, ctx=ctx_else)
 
+    true = ctx.true
+    false = ctx.false
+
     # update variables
-    changed_vars = set(ctx_then.scope.layer) | set(ctx_else.scope.layer)
-    for var_name in changed_vars:
-        val_then = ctx_then.scope.get(name=var_name)
-        val_else = ctx_else.scope.get(name=var_name)
+    then_vars = ctx_then.scope.layer
+    else_vars = ctx_else.scope.layer
+    for var_name in then_vars.keys() | else_vars.keys():
+        # if the variable is changed only in one branch,
+        # the other branch sees the value from the outer scope
+        val_then = then_vars.get(var_name)
+        if val_then is None:
+            val_then = ctx.scope.get(name=var_name)
+        val_else = else_vars.get(var_name)
+        if val_else is None:
+            val_else = ctx.scope.get(name=var_name)
         if val_then is None or val_else is None:
             continue
         value = if_expr(test_ref, val_then, val_else, ctx=ctx)
         ctx.scope.set(name=var_name, value=value)
 
     # update new assertions
-    true = types.bool.val(True, ctx=ctx)
     for constr in ctx_then.expected.layer:
         ctx.expected.add(if_expr(test_ref, constr, true, ctx=ctx))
     for constr in ctx_else.expected.layer:
         ctx.expected.add(if_expr(test_ref, true, constr, ctx=ctx))
 
     # update new exceptions
-    false = types.bool.val(False, ctx=ctx)
     for exc in ctx_then.exceptions.layer:
         ctx.exceptions.add(ExceptionInfo(
             name=exc.name,
@@ -139,7 +163,6 @@ def eval_if_else(node: astroid.If, ctx: Context) -> None:
         ))
 
     # update new return statements
-    false = types.bool.val(False, ctx=ctx)
     for ret in ctx_then.returns.layer:
         ctx.returns.add(ReturnInfo(
             value=ret.value,
@@ -154,32 +177,51 @@ def eval_if_else(node: astroid.If, ctx: Context) -> None:
 
 @eval_stmt.register(astroid.Raise)
 def eval_raise(node: astroid.Raise, ctx: Context) -> None:
-    names: set[str] = set()
-    for exc in (node.exc, node.cause):
-        if exc is None:
-            continue
-        names.update(_get_all_bases(exc))
+    exc_names = _get_names(node.exc)
+    names = exc_names.names
+    if node.cause is not None:
+        names = names | _get_names(node.cause).names
     ctx.exceptions.add(ExceptionInfo(
-        name=next(_get_all_bases(node.exc)),
+        name=exc_names.name,
         names=names,
         cond=ctx.interrupted.m_not(ctx=ctx),
     ))
 
 
+def _get_names(node) -> ExceptionNames:
+    """Get the exception name and names of all its bases.
+
+    The result depends only on the node, so it is cached for each node.
+    """
+    exc_names = _bases_cache.get(node)
+    if exc_names is None:
+        bases = [sys.intern(base) for base in _get_all_bases(node)]
+        exc_names = ExceptionNames(name=bases[0], names=frozenset(bases))
+        _bases_cache[node] = exc_names
+    return exc_names
+
+
 def _get_all_bases(node) -> typing.Iterator[str]:
-    def_nodes = infer(node)
-    for def_node in def_nodes:
-        if isinstance(def_node, astroid.Instance):
-            def_node = def_node._proxied
-        if isinstance(node, astroid.Name):
-            yield node.name
-
-        if not isinstance(def_node, astroid.ClassDef):
-            continue
-        yield def_node.name
-        for parent_node in def_node.bases:
-            if isinstance(parent_node, astroid.Name):
-                yield from _get_all_bases(parent_node)
+    # Walk the class hierarchy depth-first, visiting every class only once.
+    # For example, all builtin exceptions share `Exception` and `BaseException`.
+    seen: set[astroid.ClassDef] = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for def_node in infer(node):
+            if isinstance(def_node, astroid.Instance):
+                def_node = def_node._proxied
+            if isinstance(node, astroid.Name):
+                yield node.name
+
+            if not isinstance(def_node, astroid.ClassDef):
+                continue
+            if def_node in seen:
+                continue
+            seen.add(def_node)
+            yield def_node.name
+            parents = [p for p in def_node.bases if isinstance(p, astroid.Name)]
+            stack.extend(reversed(parents))
 
 
 @eval_stmt.register(astroid.Global)
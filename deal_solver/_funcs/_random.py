@@ -3,10 +3,14 @@ from __future__ import annotations
 import z3
 
 from .._context import Context
-from .._proxies import ProxySort, random_name, types
+from .._proxies import ProxySort, VarTupleSort, random_name, types
 from ._registry import register
 
 
+# up to how many items `random.choice` picks from explicitly listed values
+MAX_CHOICES = 8
+
+
 @register('random.Random.randint')
 def random_randint(a: ProxySort, b: ProxySort, ctx: Context, **kwargs):
     result = types.int(z3.Int(random_name('randint')))
@@ -25,11 +29,27 @@ def random_randrange(start: ProxySort, stop: ProxySort, ctx: Context, **kwargs):
 
 @register('random.Random.choice')
 def random_choice(seq: ProxySort, ctx: Context, **kwargs):
+    # If the sequence is short and its length is known,
+    # the result is one of the items rather than an item at an unknown index.
+    # All indices are in range, so items are taken without bounds checks,
+    # and they are compared structurally (NaN is equal to NaN here).
+    size_ref = seq.m_len(ctx=ctx)
+    size = z3.simplify(size_ref.expr)
+    if isinstance(seq, VarTupleSort) and z3.is_int_value(size):
+        if 0 < size.as_long() <= MAX_CHOICES:
+            subtype = seq.subtypes[0]
+            result = z3.Const(random_name('choice'), seq.expr.sort().basis())
+            ctx.given.add(types.bool(z3.Or(*[
+                result == seq.expr[i]
+                for i in range(size.as_long())
+            ])))
+            return subtype.wrap(result)
+
     zero = types.int.val(0, ctx=ctx)
     one = types.int.val(1, ctx=ctx)
     index = random_randint(
         a=zero,
-        b=seq.m_len(ctx=ctx).m_sub(one, ctx=ctx),
+        b=size_ref.m_sub(one, ctx=ctx),
         ctx=ctx,
     )
     return seq.m_getitem(index, ctx=ctx)
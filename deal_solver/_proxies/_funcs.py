@@ -24,6 +24,8 @@ def if_expr(
     val_else: T,
     ctx: Context,
 ) -> T:
+    if val_then is val_else:
+        return val_then
     expr = z3.If(
         test.m_bool(ctx=ctx).expr,
         val_then.expr,
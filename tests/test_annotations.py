@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import astroid
 import pytest
 
 from deal_solver import Conclusion, UnsupportedError
+from deal_solver._annotations import ann2sort
+from deal_solver._proxies import types
 
 from .helpers import prove_f
 
@@ -72,6 +75,7 @@ def test_asserts_ok(ann: str, check: str) -> None:
     ('', 'max'),
     ('', 'max[int]'),
     ('', '"hi"[0]'),
+    ('', '42'),
     ('from itertools import chain', 'chain'),
     ('from itertools import chain', 'chain[int]'),
     ('from glob import glob',       'glob'),
@@ -94,3 +98,13 @@ def test_real(prefer_real: bool) -> None:
             assert a == 0.0 or a != 0.0
     """)
     assert proof.conclusion is Conclusion.OK
+
+
+def test_ann2sort_cached(prefer_real: bool) -> None:
+    node = astroid.extract_node('float')
+    info = ann2sort(node=node, ctx=None)
+    assert info is not None
+    assert issubclass(info.type, types.float)
+    assert info.sort == types.float.sort()
+    assert ann2sort(node=node, ctx=None) is info
+    assert ann2sort(node=astroid.extract_node('object'), ctx=None) is None
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import gc
+import weakref
+
 import astroid
 import pytest
 
-from deal_solver._ast import get_full_name, get_name
+from deal_solver._ast import get_full_name, get_name, infer
 
 
 @pytest.mark.parametrize('given, expected', [
@@ -47,3 +50,23 @@ def test_get_full_name(given, expected):
     node = astroid.extract_node(given).inferred()[0]
     actual = get_full_name(node)
     assert actual == expected
+
+
+def test_infer_cached():
+    node = astroid.extract_node('ValueError')
+    guesses = infer(node)
+    assert len(guesses) == 1
+    assert isinstance(guesses[0], astroid.ClassDef)
+    assert guesses[0].name == 'ValueError'
+    assert infer(node) is guesses
+
+
+def test_infer_cache_released():
+    module = astroid.parse('def f(): pass\nf')
+    assert infer(module.body[-1].value)
+    ref = weakref.ref(module)
+    del module
+    # astroid keeps inferred modules in its own cache, drop it first
+    astroid.MANAGER.clear_cache()
+    gc.collect()
+    assert ref() is None
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from deal_solver._context._layer import Layer
+import z3
+
+from deal_solver._context._layer import ConstraintLayer, Layer
 from deal_solver._context._trace import Trace
+from deal_solver._proxies import BoolSort
 
 
 def test_trace():
@@ -15,3 +18,15 @@ def test_trace():
 
 def test_layer_repr():
     assert repr(Layer()) == 'Layer([])'
+
+
+def test_constraint_layer():
+    x = z3.Int('x')
+    layer = ConstraintLayer()
+    layer.add(BoolSort(z3.BoolVal(True)))
+    layer.add(BoolSort(z3.And(x > 1, True)))
+    layer.add(BoolSort(x > 1))
+    child = layer.make_child()
+    child.add(BoolSort(x > 1))
+    child.add(BoolSort(x < 5))
+    assert [str(c.expr) for c in child] == ['x < 5', 'And(x > 1, True)']
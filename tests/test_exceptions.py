@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import astroid
+
 from deal_solver import Conclusion
+from deal_solver._eval_stmt import _get_names
 
 from .helpers import prove_f
 
@@ -149,3 +152,43 @@ def test_ignore_invalid():
             assert True
     """)
     assert theorem.conclusion is Conclusion.OK
+
+
+def test_custom_error_diamond_parents():
+    theorem = prove_f("""
+        class Custom(KeyError, ValueError):
+            pass
+
+        @deal.raises(LookupError)
+        def f():
+            raise Custom
+    """)
+    assert theorem.conclusion is Conclusion.OK
+
+
+def test_if_symbolic_then_fail():
+    theorem = prove_f("""
+        def f(x: int):
+            if x > 0:
+                raise ValueError
+    """)
+    assert theorem.conclusion is Conclusion.FAIL
+
+
+def test_if_symbolic_else_fail():
+    theorem = prove_f("""
+        def f(x: int):
+            if x > 0:
+                pass
+            else:
+                raise ValueError
+    """)
+    assert theorem.conclusion is Conclusion.FAIL
+
+
+def test_exception_names_cached():
+    node = astroid.extract_node('raise KeyError')
+    exc_names = _get_names(node.exc)
+    assert exc_names.name == 'KeyError'
+    assert exc_names.names == {'KeyError', 'LookupError', 'Exception', 'BaseException', 'object'}
+    assert _get_names(node.exc) is exc_names
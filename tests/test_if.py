@@ -134,3 +134,38 @@ def test_if_unbound_var_skip():
             assert True
     """)
     assert theorem.conclusion is Conclusion.OK
+
+
+def test_if_same_value_in_both_branches():
+    theorem = prove_f("""
+        def f(x: int, b: int):
+            if x > 0:
+                a = b
+            else:
+                a = b
+            assert a == b
+    """)
+    assert theorem.conclusion is Conclusion.OK
+
+
+def test_if_dead_branch_not_evaluated():
+    theorem = prove_f("""
+        def f():
+            if False:
+                unknown_name
+            assert True
+    """)
+    assert theorem.conclusion is Conclusion.OK
+
+
+def test_if_symbolic_changed_only_in_else():
+    theorem = prove_f("""
+        def f(x: int):
+            a = 1
+            if x > 0:
+                pass
+            else:
+                a = 2
+            assert (x > 0 and a == 1) or (x <= 0 and a == 2)
+    """)
+    assert theorem.conclusion is Conclusion.OK
@@ -19,6 +19,10 @@ from ..helpers import prove_f
     'random.choice([1, 1]) == 1',
     'random.choice([1, 2, 3]) < 4',
     'random.choice([1, 2, 3]) > 0',
+    'random.choice((1, 2)) in (1, 2)',
+    'random.choice("ab") in "ab"',
+    'random.choice([1, 2, 3, 4, 5, 6, 7, 8, 9]) > 0',
+    'len(random.choice([[1], [2, 3]])) >= 1',
 
     # 'random.random() > -.1',
     # 'random.random() < 1.1',
@@ -33,3 +37,25 @@ def test_random_module(check: str) -> None:
     text = text.format(check)
     theorem = prove_f(text)
     assert theorem.conclusion is Conclusion.OK
+
+
+def test_choice_no_index_errors() -> None:
+    theorem = prove_f("""
+        import random
+
+        def f():
+            assert len(random.choice([[1], [2, 3]])) >= 1
+    """)
+    assert theorem.conclusion is Conclusion.OK
+    assert theorem.description == 'assertion'
+
+
+def test_choice_nan_is_not_contradiction() -> None:
+    theorem = prove_f("""
+        import random
+
+        def f():
+            x = random.choice([float('nan')])
+            assert False
+    """)
+    assert theorem.conclusion is Conclusion.FAIL